@@ -33,7 +33,7 @@ def f():
 lines = code.splitlines(keepends=True)
 
 
-(function_node,) = compile(code, "test_cf", "exec", ast.PyCF_ONLY_AST).body
+(function_node,) = ast.parse(code, "test_cf").body
 analysis = CFAnalyser().analyse_function(function_node)
 
 graph = analysis._graph
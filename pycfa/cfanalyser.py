@@ -136,7 +136,7 @@ class CFAnalyser:
         """
         Determine whether the given node has direct parents.
         """
-        return bool(self._graph._backedges[node])
+        return bool(self._graph.edges_to(node))
 
     def _analyse_loop(
         self,
@@ -17,7 +17,7 @@ Result of a control flow analysis applied to a module,
 function, coroutine or class.
 """
 
-from typing import Iterable, Optional, Set
+from typing import Iterable, Optional, Set, Tuple
 
 from pycfa.cfgraph import CFGraph
 from pycfa.cfnode import CFNode
@@ -79,5 +79,15 @@ class CFAnalysis:
     def edge_labels(self, source: CFNode) -> Set[str]:
         """
         Get labels of all edges.
+
+        The result is a new set: changing it does not affect the analysis.
         """
         return self._graph.edge_labels(source)
+
+    def edges_to(self, target: CFNode) -> Set[Tuple[CFNode, str]]:
+        """
+        Set of pairs (source, label) representing edges to this node.
+
+        The result is a new set: changing it does not affect the analysis.
+        """
+        return set(self._graph.edges_to(target))
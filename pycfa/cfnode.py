@@ -35,6 +35,8 @@ class CFNode:
         Text annotation
     """
 
+    __slots__ = ("ast_node", "annotation")
+
     ast_node: Optional[ast.AST]
 
     annotation: Optional[str]
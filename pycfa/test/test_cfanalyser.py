@@ -17,14 +17,37 @@ Tests for CFAnalyser class.
 """
 
 import ast
+import functools
 import unittest
-from typing import Optional, Set, Tuple, Type
+from typing import AbstractSet, FrozenSet, Optional, Set, Tuple, Type
 
 from pycfa.cfanalyser import CFAnalyser, ELSE, ENTER, ERROR, NEXT
 from pycfa.cfanalysis import CFAnalysis
 from pycfa.cfnode import CFNode
 
 
+@functools.lru_cache(maxsize=None)
+def parse(code: str) -> ast.Module:
+    """
+    Parse the given source, returning an ast.Module.
+
+    Results are cached: the analyser never modifies the tree it's given,
+    so each distinct source only needs to be parsed once per test run.
+    """
+    return ast.parse(code, "test_cf")
+
+
+# Expected sets of edge labels.
+EDGES_NONE: FrozenSet[str] = frozenset()
+EDGES_ELSE = frozenset({ELSE})
+EDGES_ENTER = frozenset({ENTER})
+EDGES_ERROR = frozenset({ERROR})
+EDGES_NEXT = frozenset({NEXT})
+EDGES_ENTER_ERROR = frozenset({ENTER, ERROR})
+EDGES_NEXT_ERROR = frozenset({NEXT, ERROR})
+EDGES_ELSE_ENTER_ERROR = frozenset({ELSE, ENTER, ERROR})
+
+
 def all_statements(tree: ast.AST) -> Set[ast.stmt]:
     """
     Return the set of all ast.stmt nodes in a tree.
@@ -40,7 +63,6 @@ def analysed_statements(analysis: CFAnalysis) -> Set[ast.stmt]:
     return {
         node.ast_node
         for node in analysis.nodes()
-        if hasattr(node, "ast_node")
         if isinstance(node.ast_node, ast.stmt)
     }
 
@@ -53,7 +75,7 @@ def f():
 """
         analysis, pass_node = self._function_analysis(code)
         self.assertNodetype(pass_node, ast.Pass)
-        self.assertEdges(analysis, pass_node, {NEXT})
+        self.assertEdges(analysis, pass_node, EDGES_NEXT)
         self.assertEdge(analysis, pass_node, NEXT, analysis.leave_node)
 
     def test_analyse_single_expr_statement(self) -> None:
@@ -63,7 +85,7 @@ def f():
 """
         analysis, stmt_node = self._function_analysis(code)
         self.assertNodetype(stmt_node, ast.Expr)
-        self.assertEdges(analysis, stmt_node, {NEXT, ERROR})
+        self.assertEdges(analysis, stmt_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, stmt_node, NEXT, analysis.leave_node)
         self.assertEdge(analysis, stmt_node, ERROR, analysis.raise_node)
 
@@ -74,7 +96,7 @@ def f():
 """
         analysis, stmt_node = self._function_analysis(code)
         self.assertNodetype(stmt_node, ast.Assign)
-        self.assertEdges(analysis, stmt_node, {NEXT, ERROR})
+        self.assertEdges(analysis, stmt_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, stmt_node, NEXT, analysis.leave_node)
         self.assertEdge(analysis, stmt_node, ERROR, analysis.raise_node)
 
@@ -86,12 +108,12 @@ def f():
 """
         analysis, stmt1_node = self._function_analysis(code)
         self.assertNodetype(stmt1_node, ast.Expr)
-        self.assertEdges(analysis, stmt1_node, {NEXT, ERROR})
+        self.assertEdges(analysis, stmt1_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, stmt1_node, ERROR, analysis.raise_node)
 
         stmt2_node = analysis.edge(stmt1_node, NEXT)
         self.assertNodetype(stmt2_node, ast.AugAssign)
-        self.assertEdges(analysis, stmt2_node, {NEXT, ERROR})
+        self.assertEdges(analysis, stmt2_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, stmt2_node, NEXT, analysis.leave_node)
         self.assertEdge(analysis, stmt2_node, ERROR, analysis.raise_node)
 
@@ -102,7 +124,7 @@ def f():
 """
         analysis, stmt_node = self._function_analysis(code)
         self.assertNodetype(stmt_node, ast.Return)
-        self.assertEdges(analysis, stmt_node, {NEXT})
+        self.assertEdges(analysis, stmt_node, EDGES_NEXT)
         self.assertEdge(analysis, stmt_node, NEXT, analysis.leave_node)
 
     def test_return_with_value(self) -> None:
@@ -112,7 +134,7 @@ def f():
 """
         analysis, stmt_node = self._function_analysis(code)
         self.assertNodetype(stmt_node, ast.Return)
-        self.assertEdges(analysis, stmt_node, {NEXT, ERROR})
+        self.assertEdges(analysis, stmt_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, stmt_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, stmt_node, NEXT, analysis.return_node)
 
@@ -123,7 +145,7 @@ def f():
 """
         analysis, stmt_node = self._function_analysis(code)
         self.assertNodetype(stmt_node, ast.Raise)
-        self.assertEdges(analysis, stmt_node, {ERROR})
+        self.assertEdges(analysis, stmt_node, EDGES_ERROR)
         self.assertEdge(analysis, stmt_node, ERROR, analysis.raise_node)
 
     def test_if(self) -> None:
@@ -134,12 +156,12 @@ def f():
 """
         analysis, if_node = self._function_analysis(code)
         self.assertNodetype(if_node, ast.If)
-        self.assertEdges(analysis, if_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, if_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, if_node, ERROR, analysis.raise_node)
 
         if_branch = analysis.edge(if_node, ENTER)
         self.assertNodetype(if_branch, ast.Assign)
-        self.assertEdges(analysis, if_branch, {NEXT, ERROR})
+        self.assertEdges(analysis, if_branch, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, if_branch, ERROR, analysis.raise_node)
         self.assertEdge(analysis, if_branch, NEXT, analysis.leave_node)
         self.assertEdge(analysis, if_node, ELSE, analysis.leave_node)
@@ -154,18 +176,18 @@ def f():
 """
         analysis, if_node = self._function_analysis(code)
         self.assertNodetype(if_node, ast.If)
-        self.assertEdges(analysis, if_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, if_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, if_node, ERROR, analysis.raise_node)
 
         if_branch = analysis.edge(if_node, ENTER)
         self.assertNodetype(if_branch, ast.Assign)
-        self.assertEdges(analysis, if_branch, {NEXT, ERROR})
+        self.assertEdges(analysis, if_branch, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, if_branch, ERROR, analysis.raise_node)
         self.assertEdge(analysis, if_branch, NEXT, analysis.leave_node)
 
         else_branch = analysis.edge(if_node, ELSE)
         self.assertNodetype(else_branch, ast.Assign)
-        self.assertEdges(analysis, else_branch, {NEXT, ERROR})
+        self.assertEdges(analysis, else_branch, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, else_branch, ERROR, analysis.raise_node)
         self.assertEdge(analysis, else_branch, NEXT, analysis.leave_node)
 
@@ -181,29 +203,29 @@ def f():
 """
         analysis, if_node = self._function_analysis(code)
         self.assertNodetype(if_node, ast.If)
-        self.assertEdges(analysis, if_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, if_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, if_node, ERROR, analysis.raise_node)
 
         if_branch = analysis.edge(if_node, ENTER)
         self.assertNodetype(if_branch, ast.Assign)
-        self.assertEdges(analysis, if_branch, {NEXT, ERROR})
+        self.assertEdges(analysis, if_branch, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, if_branch, ERROR, analysis.raise_node)
         self.assertEdge(analysis, if_branch, NEXT, analysis.leave_node)
 
         elif_node = analysis.edge(if_node, ELSE)
         self.assertNodetype(elif_node, ast.If)
-        self.assertEdges(analysis, elif_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, elif_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, elif_node, ERROR, analysis.raise_node)
 
         elif_branch = analysis.edge(elif_node, ENTER)
         self.assertNodetype(elif_branch, ast.Assign)
-        self.assertEdges(analysis, elif_branch, {NEXT, ERROR})
+        self.assertEdges(analysis, elif_branch, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, elif_branch, ERROR, analysis.raise_node)
         self.assertEdge(analysis, elif_branch, NEXT, analysis.leave_node)
 
         else_branch = analysis.edge(elif_node, ELSE)
         self.assertNodetype(else_branch, ast.Assign)
-        self.assertEdges(analysis, else_branch, {NEXT, ERROR})
+        self.assertEdges(analysis, else_branch, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, else_branch, ERROR, analysis.raise_node)
         self.assertEdge(analysis, else_branch, NEXT, analysis.leave_node)
 
@@ -217,18 +239,18 @@ def f():
 """
         analysis, if_node = self._function_analysis(code)
         self.assertNodetype(if_node, ast.If)
-        self.assertEdges(analysis, if_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, if_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, if_node, ERROR, analysis.raise_node)
 
         if_branch = analysis.edge(if_node, ENTER)
         self.assertNodetype(if_branch, ast.Return)
-        self.assertEdges(analysis, if_branch, {NEXT, ERROR})
+        self.assertEdges(analysis, if_branch, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, if_branch, NEXT, analysis.return_node)
         self.assertEdge(analysis, if_branch, ERROR, analysis.raise_node)
 
         else_node = analysis.edge(if_node, ELSE)
         self.assertNodetype(else_node, ast.Return)
-        self.assertEdges(analysis, else_node, {NEXT, ERROR})
+        self.assertEdges(analysis, else_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, else_node, NEXT, analysis.return_node)
         self.assertEdge(analysis, else_node, ERROR, analysis.raise_node)
 
@@ -242,17 +264,17 @@ def f():
 """
         analysis, if_node = self._function_analysis(code)
         self.assertNodetype(if_node, ast.If)
-        self.assertEdges(analysis, if_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, if_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, if_node, ERROR, analysis.raise_node)
 
         if_branch = analysis.edge(if_node, ENTER)
         self.assertNodetype(if_branch, ast.Return)
-        self.assertEdges(analysis, if_branch, {NEXT})
+        self.assertEdges(analysis, if_branch, EDGES_NEXT)
         self.assertEdge(analysis, if_branch, NEXT, analysis.leave_node)
 
         else_node = analysis.edge(if_node, ELSE)
         self.assertNodetype(else_node, ast.Return)
-        self.assertEdges(analysis, else_node, {NEXT})
+        self.assertEdges(analysis, else_node, EDGES_NEXT)
         self.assertEdge(analysis, else_node, NEXT, analysis.leave_node)
 
     def test_unreachable_statements(self) -> None:
@@ -264,12 +286,12 @@ def f():
 """
         analysis, stmt1_node = self._function_analysis(code)
         self.assertNodetype(stmt1_node, ast.Expr)
-        self.assertEdges(analysis, stmt1_node, {NEXT, ERROR})
+        self.assertEdges(analysis, stmt1_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, stmt1_node, ERROR, analysis.raise_node)
 
         stmt2_node = analysis.edge(stmt1_node, NEXT)
         self.assertNodetype(stmt2_node, ast.Return)
-        self.assertEdges(analysis, stmt2_node, {NEXT})
+        self.assertEdges(analysis, stmt2_node, EDGES_NEXT)
         self.assertEdge(analysis, stmt2_node, NEXT, analysis.leave_node)
 
     def test_while(self) -> None:
@@ -280,16 +302,59 @@ def f():
 """
         analysis, while_node = self._function_analysis(code)
         self.assertNodetype(while_node, ast.While)
-        self.assertEdges(analysis, while_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, while_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, while_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, while_node, ELSE, analysis.leave_node)
 
         body_node = analysis.edge(while_node, ENTER)
         self.assertNodetype(body_node, ast.Expr)
-        self.assertEdges(analysis, body_node, {NEXT, ERROR})
+        self.assertEdges(analysis, body_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, body_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, body_node, NEXT, while_node)
 
+    def test_edges_to(self) -> None:
+        code = """\
+def f():
+    a = 123
+    while some_condition:
+        if other_condition:
+            continue
+        do_something()
+"""
+        analysis, assign_node = self._function_analysis(code)
+        while_node = analysis.edge(assign_node, NEXT)
+        self.assertNodetype(while_node, ast.While)
+
+        if_node = analysis.edge(while_node, ENTER)
+        continue_node = analysis.edge(if_node, ENTER)
+        self.assertNodetype(continue_node, ast.Continue)
+        do_node = analysis.edge(if_node, ELSE)
+        self.assertNodetype(do_node, ast.Expr)
+
+        self.assertEqual(analysis.edges_to(if_node), {(while_node, ENTER)})
+        self.assertEqual(
+            analysis.edges_to(while_node),
+            {(assign_node, NEXT), (continue_node, NEXT), (do_node, NEXT)},
+        )
+
+    def test_edges_to_returns_copy(self) -> None:
+        code = """\
+def f():
+    while some_condition:
+        do_something()
+"""
+        analysis, while_node = self._function_analysis(code)
+        body_node = analysis.edge(while_node, ENTER)
+
+        edges = analysis.edges_to(while_node)
+        self.assertIn((body_node, NEXT), edges)
+        edges.clear()
+        self.assertIn((body_node, NEXT), analysis.edges_to(while_node))
+
+        labels = analysis.edge_labels(while_node)
+        labels.clear()
+        self.assertEqual(analysis.edge_labels(while_node), EDGES_ELSE_ENTER_ERROR)
+
     def test_while_else(self) -> None:
         code = """\
 def f():
@@ -300,18 +365,18 @@ def f():
 """
         analysis, while_node = self._function_analysis(code)
         self.assertNodetype(while_node, ast.While)
-        self.assertEdges(analysis, while_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, while_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, while_node, ERROR, analysis.raise_node)
 
         body_node = analysis.edge(while_node, ENTER)
         self.assertNodetype(body_node, ast.Expr)
-        self.assertEdges(analysis, body_node, {NEXT, ERROR})
+        self.assertEdges(analysis, body_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, body_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, body_node, NEXT, while_node)
 
         else_node = analysis.edge(while_node, ELSE)
         self.assertNodetype(else_node, ast.Expr)
-        self.assertEdges(analysis, else_node, {NEXT, ERROR})
+        self.assertEdges(analysis, else_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, else_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, else_node, NEXT, analysis.leave_node)
 
@@ -327,28 +392,28 @@ def f():
 """
         analysis, while_node = self._function_analysis(code)
         self.assertNodetype(while_node, ast.While)
-        self.assertEdges(analysis, while_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, while_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, while_node, ERROR, analysis.raise_node)
 
         test_node = analysis.edge(while_node, ENTER)
         self.assertNodetype(test_node, ast.If)
         self.assertEdge(analysis, test_node, ERROR, analysis.raise_node)
-        self.assertEdges(analysis, test_node, {ENTER, ELSE, ERROR})
+        self.assertEdges(analysis, test_node, EDGES_ELSE_ENTER_ERROR)
 
         continue_node = analysis.edge(test_node, ENTER)
         self.assertNodetype(continue_node, ast.Continue)
-        self.assertEdges(analysis, continue_node, {NEXT})
+        self.assertEdges(analysis, continue_node, EDGES_NEXT)
         self.assertEdge(analysis, continue_node, NEXT, while_node)
 
         body_node = analysis.edge(test_node, ELSE)
         self.assertNodetype(body_node, ast.Expr)
-        self.assertEdges(analysis, body_node, {NEXT, ERROR})
+        self.assertEdges(analysis, body_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, body_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, body_node, NEXT, while_node)
 
         else_node = analysis.edge(while_node, ELSE)
         self.assertNodetype(else_node, ast.Expr)
-        self.assertEdges(analysis, else_node, {NEXT, ERROR})
+        self.assertEdges(analysis, else_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, else_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, else_node, NEXT, analysis.leave_node)
 
@@ -364,28 +429,28 @@ def f():
 """
         analysis, while_node = self._function_analysis(code)
         self.assertNodetype(while_node, ast.While)
-        self.assertEdges(analysis, while_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, while_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, while_node, ERROR, analysis.raise_node)
 
         test_node = analysis.edge(while_node, ENTER)
         self.assertNodetype(test_node, ast.If)
         self.assertEdge(analysis, test_node, ERROR, analysis.raise_node)
-        self.assertEdges(analysis, test_node, {ENTER, ELSE, ERROR})
+        self.assertEdges(analysis, test_node, EDGES_ELSE_ENTER_ERROR)
 
         break_node = analysis.edge(test_node, ENTER)
         self.assertNodetype(break_node, ast.Break)
-        self.assertEdges(analysis, break_node, {NEXT})
+        self.assertEdges(analysis, break_node, EDGES_NEXT)
         self.assertEdge(analysis, break_node, NEXT, analysis.leave_node)
 
         body_node = analysis.edge(test_node, ELSE)
         self.assertNodetype(body_node, ast.Expr)
-        self.assertEdges(analysis, body_node, {NEXT, ERROR})
+        self.assertEdges(analysis, body_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, body_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, body_node, NEXT, while_node)
 
         else_node = analysis.edge(while_node, ELSE)
         self.assertNodetype(else_node, ast.Expr)
-        self.assertEdges(analysis, else_node, {NEXT, ERROR})
+        self.assertEdges(analysis, else_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, else_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, else_node, NEXT, analysis.leave_node)
 
@@ -398,18 +463,18 @@ def f():
 """
         analysis, while_node = self._function_analysis(code)
         self.assertNodetype(while_node, ast.While)
-        self.assertEdges(analysis, while_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, while_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, while_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, while_node, ELSE, analysis.leave_node)
 
         body_node1 = analysis.edge(while_node, ENTER)
         self.assertNodetype(body_node1, ast.Expr)
-        self.assertEdges(analysis, body_node1, {NEXT, ERROR})
+        self.assertEdges(analysis, body_node1, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, body_node1, ERROR, analysis.raise_node)
 
         body_node2 = analysis.edge(body_node1, NEXT)
         self.assertNodetype(body_node2, ast.Expr)
-        self.assertEdges(analysis, body_node2, {NEXT, ERROR})
+        self.assertEdges(analysis, body_node2, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, body_node2, ERROR, analysis.raise_node)
         self.assertEdge(analysis, body_node2, NEXT, while_node)
 
@@ -421,11 +486,11 @@ def f():
 """
         analysis, while_node = self._function_analysis(code)
         self.assertNodetype(while_node, ast.While)
-        self.assertEdges(analysis, while_node, {ENTER})
+        self.assertEdges(analysis, while_node, EDGES_ENTER)
 
         pass_node = analysis.edge(while_node, ENTER)
         self.assertNodetype(pass_node, ast.Pass)
-        self.assertEdges(analysis, pass_node, {NEXT})
+        self.assertEdges(analysis, pass_node, EDGES_NEXT)
         self.assertEdge(analysis, pass_node, NEXT, while_node)
 
         self.assertIsNone(analysis.leave_node)
@@ -440,7 +505,7 @@ def f():
 """
         analysis, while_node = self._function_analysis(code)
         self.assertNodetype(while_node, ast.While)
-        self.assertEdges(analysis, while_node, {ELSE})
+        self.assertEdges(analysis, while_node, EDGES_ELSE)
         self.assertEdge(analysis, while_node, ELSE, analysis.leave_node)
 
     def test_if_true(self) -> None:
@@ -452,11 +517,11 @@ else:
 """
         analysis, if_node = self._module_analysis(code)
         self.assertNodetype(if_node, ast.If)
-        self.assertEdges(analysis, if_node, {ENTER})
+        self.assertEdges(analysis, if_node, EDGES_ENTER)
 
         pass_node = analysis.edge(if_node, ENTER)
         self.assertNodetype(pass_node, ast.Pass)
-        self.assertEdges(analysis, pass_node, {NEXT})
+        self.assertEdges(analysis, pass_node, EDGES_NEXT)
 
         self.assertEdge(analysis, pass_node, NEXT, analysis.leave_node)
 
@@ -469,11 +534,11 @@ else:
 """
         analysis, if_node = self._module_analysis(code)
         self.assertNodetype(if_node, ast.If)
-        self.assertEdges(analysis, if_node, {ELSE})
+        self.assertEdges(analysis, if_node, EDGES_ELSE)
 
         pass_node = analysis.edge(if_node, ELSE)
         self.assertNodetype(pass_node, ast.Pass)
-        self.assertEdges(analysis, pass_node, {NEXT})
+        self.assertEdges(analysis, pass_node, EDGES_NEXT)
 
         self.assertEdge(analysis, pass_node, NEXT, analysis.leave_node)
 
@@ -499,7 +564,7 @@ else:
 """
             with self.subTest(code=code):
                 analysis, if_node = self._module_analysis(code)
-                self.assertEdges(analysis, if_node, {ENTER})
+                self.assertEdges(analysis, if_node, EDGES_ENTER)
 
         for false_constant in false_constants:
             code = f"""\
@@ -510,7 +575,7 @@ else:
 """
             with self.subTest(code=code):
                 analysis, if_node = self._module_analysis(code)
-                self.assertEdges(analysis, if_node, {ELSE})
+                self.assertEdges(analysis, if_node, EDGES_ELSE)
 
     def test_assert_true(self) -> None:
         # Note that some_expression is not evaluated if the constant is true,
@@ -520,7 +585,7 @@ assert True, some_expression()
 """
         analysis, assert_node = self._module_analysis(code)
         self.assertNodetype(assert_node, ast.Assert)
-        self.assertEdges(analysis, assert_node, {NEXT})
+        self.assertEdges(analysis, assert_node, EDGES_NEXT)
         self.assertEdge(analysis, assert_node, NEXT, analysis.leave_node)
 
     def test_assert_false(self) -> None:
@@ -532,7 +597,7 @@ assert False, some_expression()
 """
         analysis, assert_node = self._module_analysis(code)
         self.assertNodetype(assert_node, ast.Assert)
-        self.assertEdges(analysis, assert_node, {ERROR})
+        self.assertEdges(analysis, assert_node, EDGES_ERROR)
         self.assertEdge(analysis, assert_node, ERROR, analysis.raise_node)
 
     def test_assert_true_without_message(self) -> None:
@@ -543,7 +608,7 @@ assert True
 """
         analysis, assert_node = self._module_analysis(code)
         self.assertNodetype(assert_node, ast.Assert)
-        self.assertEdges(analysis, assert_node, {NEXT})
+        self.assertEdges(analysis, assert_node, EDGES_NEXT)
         self.assertEdge(analysis, assert_node, NEXT, analysis.leave_node)
 
     def test_assert_false_without_message(self) -> None:
@@ -555,7 +620,7 @@ assert False
 """
         analysis, assert_node = self._module_analysis(code)
         self.assertNodetype(assert_node, ast.Assert)
-        self.assertEdges(analysis, assert_node, {ERROR})
+        self.assertEdges(analysis, assert_node, EDGES_ERROR)
         self.assertEdge(analysis, assert_node, ERROR, analysis.raise_node)
 
     def test_assert_general(self) -> None:
@@ -564,7 +629,7 @@ assert some_test(), some_expression()
 """
         analysis, assert_node = self._module_analysis(code)
         self.assertNodetype(assert_node, ast.Assert)
-        self.assertEdges(analysis, assert_node, {ERROR, NEXT})
+        self.assertEdges(analysis, assert_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, assert_node, NEXT, analysis.leave_node)
         self.assertEdge(analysis, assert_node, ERROR, analysis.raise_node)
 
@@ -612,28 +677,28 @@ def f():
 """
         analysis, for_node = self._function_analysis(code)
         self.assertNodetype(for_node, ast.For)
-        self.assertEdges(analysis, for_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, for_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, for_node, ERROR, analysis.raise_node)
 
         test_node = analysis.edge(for_node, ENTER)
         self.assertNodetype(test_node, ast.If)
         self.assertEdge(analysis, test_node, ERROR, analysis.raise_node)
-        self.assertEdges(analysis, test_node, {ENTER, ELSE, ERROR})
+        self.assertEdges(analysis, test_node, EDGES_ELSE_ENTER_ERROR)
 
         continue_node = analysis.edge(test_node, ENTER)
         self.assertNodetype(continue_node, ast.Continue)
-        self.assertEdges(analysis, continue_node, {NEXT})
+        self.assertEdges(analysis, continue_node, EDGES_NEXT)
         self.assertEdge(analysis, continue_node, NEXT, for_node)
 
         body_node = analysis.edge(test_node, ELSE)
         self.assertNodetype(body_node, ast.Expr)
-        self.assertEdges(analysis, body_node, {NEXT, ERROR})
+        self.assertEdges(analysis, body_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, body_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, body_node, NEXT, for_node)
 
         else_node = analysis.edge(for_node, ELSE)
         self.assertNodetype(else_node, ast.Expr)
-        self.assertEdges(analysis, else_node, {NEXT, ERROR})
+        self.assertEdges(analysis, else_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, else_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, else_node, NEXT, analysis.leave_node)
 
@@ -649,28 +714,28 @@ def f():
 """
         analysis, for_node = self._function_analysis(code)
         self.assertNodetype(for_node, ast.For)
-        self.assertEdges(analysis, for_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, for_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, for_node, ERROR, analysis.raise_node)
 
         test_node = analysis.edge(for_node, ENTER)
         self.assertNodetype(test_node, ast.If)
         self.assertEdge(analysis, test_node, ERROR, analysis.raise_node)
-        self.assertEdges(analysis, test_node, {ENTER, ELSE, ERROR})
+        self.assertEdges(analysis, test_node, EDGES_ELSE_ENTER_ERROR)
 
         break_node = analysis.edge(test_node, ENTER)
         self.assertNodetype(break_node, ast.Break)
-        self.assertEdges(analysis, break_node, {NEXT})
+        self.assertEdges(analysis, break_node, EDGES_NEXT)
         self.assertEdge(analysis, break_node, NEXT, analysis.leave_node)
 
         body_node = analysis.edge(test_node, ELSE)
         self.assertNodetype(body_node, ast.Expr)
-        self.assertEdges(analysis, body_node, {NEXT, ERROR})
+        self.assertEdges(analysis, body_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, body_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, body_node, NEXT, for_node)
 
         else_node = analysis.edge(for_node, ELSE)
         self.assertNodetype(else_node, ast.Expr)
-        self.assertEdges(analysis, else_node, {NEXT, ERROR})
+        self.assertEdges(analysis, else_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, else_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, else_node, NEXT, analysis.leave_node)
 
@@ -688,32 +753,32 @@ def f():
 """
         analysis, start_node = self._function_analysis(code)
         self.assertNodetype(start_node, ast.Try)
-        self.assertEdges(analysis, start_node, {NEXT})
+        self.assertEdges(analysis, start_node, EDGES_NEXT)
 
         try_node = analysis.edge(start_node, NEXT)
         self.assertNodetype(try_node, ast.Expr)
-        self.assertEdges(analysis, try_node, {NEXT, ERROR})
+        self.assertEdges(analysis, try_node, EDGES_NEXT_ERROR)
 
         except1_node = analysis.edge(try_node, ERROR)
-        self.assertNodetype(except1_node, ast.expr)
-        self.assertEdges(analysis, except1_node, {ENTER, ELSE, ERROR})
+        self.assertNodetype(except1_node, ast.Name)
+        self.assertEdges(analysis, except1_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, except1_node, ERROR, analysis.raise_node)
 
         match1_node = analysis.edge(except1_node, ENTER)
         self.assertNodetype(match1_node, ast.Expr)
-        self.assertEdges(analysis, match1_node, {NEXT, ERROR})
+        self.assertEdges(analysis, match1_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, match1_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, match1_node, NEXT, analysis.leave_node)
 
         match2_node = analysis.edge(except1_node, ELSE)
         self.assertNodetype(match2_node, ast.Expr)
-        self.assertEdges(analysis, match2_node, {NEXT, ERROR})
+        self.assertEdges(analysis, match2_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, match2_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, match2_node, NEXT, analysis.leave_node)
 
         else_node = analysis.edge(try_node, NEXT)
         self.assertNodetype(else_node, ast.Expr)
-        self.assertEdges(analysis, else_node, {NEXT, ERROR})
+        self.assertEdges(analysis, else_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, else_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, else_node, NEXT, analysis.leave_node)
 
@@ -727,16 +792,16 @@ def f():
 """
         analysis, start_node = self._function_analysis(code)
         self.assertNodetype(start_node, ast.Try)
-        self.assertEdges(analysis, start_node, {NEXT})
+        self.assertEdges(analysis, start_node, EDGES_NEXT)
 
         try_node = analysis.edge(start_node, NEXT)
         self.assertNodetype(try_node, ast.Expr)
-        self.assertEdges(analysis, try_node, {NEXT, ERROR})
+        self.assertEdges(analysis, try_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, try_node, NEXT, analysis.leave_node)
 
         pass_node = analysis.edge(try_node, ERROR)
         self.assertNodetype(pass_node, ast.Pass)
-        self.assertEdges(analysis, pass_node, {NEXT})
+        self.assertEdges(analysis, pass_node, EDGES_NEXT)
         self.assertEdge(analysis, pass_node, NEXT, analysis.leave_node)
 
     def test_raise_in_try(self) -> None:
@@ -752,21 +817,21 @@ def f():
 """
         analysis, start_node = self._function_analysis(code)
         self.assertNodetype(start_node, ast.Try)
-        self.assertEdges(analysis, start_node, {NEXT})
+        self.assertEdges(analysis, start_node, EDGES_NEXT)
 
         try_node = analysis.edge(start_node, NEXT)
         self.assertNodetype(try_node, ast.Raise)
-        self.assertEdges(analysis, try_node, {ERROR})
+        self.assertEdges(analysis, try_node, EDGES_ERROR)
 
         except_node = analysis.edge(try_node, ERROR)
-        self.assertNodetype(except_node, ast.expr)
-        self.assertEdges(analysis, except_node, {ENTER, ELSE, ERROR})
+        self.assertNodetype(except_node, ast.Name)
+        self.assertEdges(analysis, except_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, except_node, ELSE, analysis.raise_node)
         self.assertEdge(analysis, except_node, ERROR, analysis.raise_node)
 
         pass_node = analysis.edge(except_node, ENTER)
         self.assertNodetype(pass_node, ast.Pass)
-        self.assertEdges(analysis, pass_node, {NEXT})
+        self.assertEdges(analysis, pass_node, EDGES_NEXT)
         self.assertEdge(analysis, pass_node, NEXT, analysis.leave_node)
 
     def test_try_finally_pass(self) -> None:
@@ -779,15 +844,15 @@ def f():
 """
         analysis, start_node = self._function_analysis(code)
         self.assertNodetype(start_node, ast.Try)
-        self.assertEdges(analysis, start_node, {NEXT})
+        self.assertEdges(analysis, start_node, EDGES_NEXT)
 
         try_node = analysis.edge(start_node, NEXT)
         self.assertNodetype(try_node, ast.Pass)
-        self.assertEdges(analysis, try_node, {NEXT})
+        self.assertEdges(analysis, try_node, EDGES_NEXT)
 
         finally_node = analysis.edge(try_node, NEXT)
         self.assertNodetype(finally_node, ast.Expr)
-        self.assertEdges(analysis, finally_node, {NEXT, ERROR})
+        self.assertEdges(analysis, finally_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, finally_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, finally_node, NEXT, analysis.leave_node)
 
@@ -801,15 +866,15 @@ def f():
 """
         analysis, start_node = self._function_analysis(code)
         self.assertNodetype(start_node, ast.Try)
-        self.assertEdges(analysis, start_node, {NEXT})
+        self.assertEdges(analysis, start_node, EDGES_NEXT)
 
         try_node = analysis.edge(start_node, NEXT)
         self.assertNodetype(try_node, ast.Raise)
-        self.assertEdges(analysis, try_node, {ERROR})
+        self.assertEdges(analysis, try_node, EDGES_ERROR)
 
         finally_node = analysis.edge(try_node, ERROR)
         self.assertNodetype(finally_node, ast.Expr)
-        self.assertEdges(analysis, finally_node, {NEXT, ERROR})
+        self.assertEdges(analysis, finally_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, finally_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, finally_node, NEXT, analysis.raise_node)
 
@@ -823,15 +888,15 @@ def f():
 """
         analysis, start_node = self._function_analysis(code)
         self.assertNodetype(start_node, ast.Try)
-        self.assertEdges(analysis, start_node, {NEXT})
+        self.assertEdges(analysis, start_node, EDGES_NEXT)
 
         try_node = analysis.edge(start_node, NEXT)
         self.assertNodetype(try_node, ast.Return)
-        self.assertEdges(analysis, try_node, {NEXT})
+        self.assertEdges(analysis, try_node, EDGES_NEXT)
 
         finally_node = analysis.edge(try_node, NEXT)
         self.assertNodetype(finally_node, ast.Expr)
-        self.assertEdges(analysis, finally_node, {NEXT, ERROR})
+        self.assertEdges(analysis, finally_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, finally_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, finally_node, NEXT, analysis.leave_node)
 
@@ -845,21 +910,21 @@ def f():
 """
         analysis, start_node = self._function_analysis(code)
         self.assertNodetype(start_node, ast.Try)
-        self.assertEdges(analysis, start_node, {NEXT})
+        self.assertEdges(analysis, start_node, EDGES_NEXT)
 
         try_node = analysis.edge(start_node, NEXT)
         self.assertNodetype(try_node, ast.Return)
-        self.assertEdges(analysis, try_node, {NEXT, ERROR})
+        self.assertEdges(analysis, try_node, EDGES_NEXT_ERROR)
 
         finally_node = analysis.edge(try_node, NEXT)
         self.assertNodetype(finally_node, ast.Expr)
-        self.assertEdges(analysis, finally_node, {NEXT, ERROR})
+        self.assertEdges(analysis, finally_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, finally_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, finally_node, NEXT, analysis.return_node)
 
         finally2_node = analysis.edge(try_node, ERROR)
         self.assertNodetype(finally2_node, ast.Expr)
-        self.assertEdges(analysis, finally2_node, {NEXT, ERROR})
+        self.assertEdges(analysis, finally2_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, finally2_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, finally2_node, NEXT, analysis.raise_node)
 
@@ -874,21 +939,21 @@ def f():
 """
         analysis, for_node = self._function_analysis(code)
         self.assertNodetype(for_node, ast.For)
-        self.assertEdges(analysis, for_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, for_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, for_node, ELSE, analysis.leave_node)
         self.assertEdge(analysis, for_node, ERROR, analysis.raise_node)
 
         try_node = analysis.edge(for_node, ENTER)
         self.assertNodetype(try_node, ast.Try)
-        self.assertEdges(analysis, try_node, {NEXT})
+        self.assertEdges(analysis, try_node, EDGES_NEXT)
 
         break_node = analysis.edge(try_node, NEXT)
         self.assertNodetype(break_node, ast.Break)
-        self.assertEdges(analysis, break_node, {NEXT})
+        self.assertEdges(analysis, break_node, EDGES_NEXT)
 
         finally_node = analysis.edge(break_node, NEXT)
         self.assertNodetype(finally_node, ast.Expr)
-        self.assertEdges(analysis, finally_node, {NEXT, ERROR})
+        self.assertEdges(analysis, finally_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, finally_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, finally_node, NEXT, analysis.leave_node)
 
@@ -903,20 +968,20 @@ def f():
 """
         analysis, for_node = self._function_analysis(code)
 
-        self.assertEdges(analysis, for_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, for_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, for_node, ELSE, analysis.leave_node)
         self.assertEdge(analysis, for_node, ERROR, analysis.raise_node)
 
         try_node = analysis.edge(for_node, ENTER)
-        self.assertEdges(analysis, try_node, {NEXT})
+        self.assertEdges(analysis, try_node, EDGES_NEXT)
 
         continue_node = analysis.edge(try_node, NEXT)
         self.assertNodetype(continue_node, ast.Continue)
-        self.assertEdges(analysis, continue_node, {NEXT})
+        self.assertEdges(analysis, continue_node, EDGES_NEXT)
 
         finally_node = analysis.edge(continue_node, NEXT)
         self.assertNodetype(finally_node, ast.Expr)
-        self.assertEdges(analysis, finally_node, {NEXT, ERROR})
+        self.assertEdges(analysis, finally_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, finally_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, finally_node, NEXT, for_node)
 
@@ -929,13 +994,13 @@ def f():
         return some_value()
 """
         analysis, try_node = self._function_analysis(code)
-        self.assertEdges(analysis, try_node, {NEXT})
+        self.assertEdges(analysis, try_node, EDGES_NEXT)
 
         raise_node = analysis.edge(try_node, NEXT)
-        self.assertEdges(analysis, raise_node, {ERROR})
+        self.assertEdges(analysis, raise_node, EDGES_ERROR)
 
         return_node = analysis.edge(raise_node, ERROR)
-        self.assertEdges(analysis, return_node, {NEXT, ERROR})
+        self.assertEdges(analysis, return_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, return_node, NEXT, analysis.return_node)
         self.assertEdge(analysis, return_node, ERROR, analysis.raise_node)
 
@@ -948,13 +1013,13 @@ def f():
         return
 """
         analysis, try_node = self._function_analysis(code)
-        self.assertEdges(analysis, try_node, {NEXT})
+        self.assertEdges(analysis, try_node, EDGES_NEXT)
 
         raise_node = analysis.edge(try_node, NEXT)
-        self.assertEdges(analysis, raise_node, {ERROR})
+        self.assertEdges(analysis, raise_node, EDGES_ERROR)
 
         return_node = analysis.edge(raise_node, ERROR)
-        self.assertEdges(analysis, return_node, {NEXT})
+        self.assertEdges(analysis, return_node, EDGES_NEXT)
         self.assertEdge(analysis, return_node, NEXT, analysis.leave_node)
 
     def test_raise_in_finally(self) -> None:
@@ -966,15 +1031,15 @@ def f():
         raise SomeException()
 """
         analysis, try_node = self._function_analysis(code)
-        self.assertEdges(analysis, try_node, {NEXT})
+        self.assertEdges(analysis, try_node, EDGES_NEXT)
 
         pass_node = analysis.edge(try_node, NEXT)
         self.assertNodetype(pass_node, ast.Pass)
-        self.assertEdges(analysis, pass_node, {NEXT})
+        self.assertEdges(analysis, pass_node, EDGES_NEXT)
 
         raise_node = analysis.edge(pass_node, NEXT)
         self.assertNodetype(raise_node, ast.Raise)
-        self.assertEdges(analysis, raise_node, {ERROR})
+        self.assertEdges(analysis, raise_node, EDGES_ERROR)
         self.assertEdge(analysis, raise_node, ERROR, analysis.raise_node)
 
     def test_break_in_finally(self) -> None:
@@ -989,18 +1054,18 @@ def f():
 """
         analysis, for_node = self._function_analysis(code)
 
-        self.assertEdges(analysis, for_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, for_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, for_node, ELSE, analysis.leave_node)
         self.assertEdge(analysis, for_node, ERROR, analysis.raise_node)
 
         try_node = analysis.edge(for_node, ENTER)
-        self.assertEdges(analysis, try_node, {NEXT})
+        self.assertEdges(analysis, try_node, EDGES_NEXT)
 
         return_node = analysis.edge(try_node, NEXT)
-        self.assertEdges(analysis, return_node, {NEXT})
+        self.assertEdges(analysis, return_node, EDGES_NEXT)
 
         break_node = analysis.edge(return_node, NEXT)
-        self.assertEdges(analysis, break_node, {NEXT})
+        self.assertEdges(analysis, break_node, EDGES_NEXT)
         self.assertEdge(analysis, break_node, NEXT, analysis.leave_node)
 
     def test_continue_in_finally(self) -> None:
@@ -1015,18 +1080,18 @@ def f():
 """
         analysis, for_node = self._function_analysis(code)
 
-        self.assertEdges(analysis, for_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, for_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, for_node, ELSE, analysis.leave_node)
         self.assertEdge(analysis, for_node, ERROR, analysis.raise_node)
 
         try_node = analysis.edge(for_node, ENTER)
-        self.assertEdges(analysis, try_node, {NEXT})
+        self.assertEdges(analysis, try_node, EDGES_NEXT)
 
         raise_node = analysis.edge(try_node, NEXT)
-        self.assertEdges(analysis, raise_node, {ERROR})
+        self.assertEdges(analysis, raise_node, EDGES_ERROR)
 
         continue_node = analysis.edge(raise_node, ERROR)
-        self.assertEdges(analysis, continue_node, {NEXT})
+        self.assertEdges(analysis, continue_node, EDGES_NEXT)
         self.assertEdge(analysis, continue_node, NEXT, for_node)
 
     def test_continue_in_except_no_finally(self) -> None:
@@ -1040,18 +1105,18 @@ def f():
 """
         analysis, for_node = self._function_analysis(code)
 
-        self.assertEdges(analysis, for_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, for_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, for_node, ELSE, analysis.leave_node)
         self.assertEdge(analysis, for_node, ERROR, analysis.raise_node)
 
         try_node = analysis.edge(for_node, ENTER)
-        self.assertEdges(analysis, try_node, {NEXT})
+        self.assertEdges(analysis, try_node, EDGES_NEXT)
 
         raise_node = analysis.edge(try_node, NEXT)
-        self.assertEdges(analysis, raise_node, {ERROR})
+        self.assertEdges(analysis, raise_node, EDGES_ERROR)
 
         continue_node = analysis.edge(raise_node, ERROR)
-        self.assertEdges(analysis, continue_node, {NEXT})
+        self.assertEdges(analysis, continue_node, EDGES_NEXT)
         self.assertEdge(analysis, continue_node, NEXT, for_node)
 
     def test_continue_in_except(self) -> None:
@@ -1067,21 +1132,21 @@ def f():
 """
         analysis, for_node = self._function_analysis(code)
 
-        self.assertEdges(analysis, for_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, for_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, for_node, ELSE, analysis.leave_node)
         self.assertEdge(analysis, for_node, ERROR, analysis.raise_node)
 
         try_node = analysis.edge(for_node, ENTER)
-        self.assertEdges(analysis, try_node, {NEXT})
+        self.assertEdges(analysis, try_node, EDGES_NEXT)
 
         raise_node = analysis.edge(try_node, NEXT)
-        self.assertEdges(analysis, raise_node, {ERROR})
+        self.assertEdges(analysis, raise_node, EDGES_ERROR)
 
         continue_node = analysis.edge(raise_node, ERROR)
-        self.assertEdges(analysis, continue_node, {NEXT})
+        self.assertEdges(analysis, continue_node, EDGES_NEXT)
 
         finally_node = analysis.edge(continue_node, NEXT)
-        self.assertEdges(analysis, finally_node, {NEXT, ERROR})
+        self.assertEdges(analysis, finally_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, finally_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, finally_node, NEXT, for_node)
 
@@ -1093,17 +1158,17 @@ def f():
             break
 """
         analysis, while_node = self._function_analysis(code)
-        self.assertEdges(analysis, while_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, while_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, while_node, ELSE, analysis.leave_node)
         self.assertEdge(analysis, while_node, ERROR, analysis.raise_node)
 
         inner_while_node = analysis.edge(while_node, ENTER)
-        self.assertEdges(analysis, inner_while_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, inner_while_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, inner_while_node, ELSE, while_node)
         self.assertEdge(analysis, inner_while_node, ERROR, analysis.raise_node)
 
         break_node = analysis.edge(inner_while_node, ENTER)
-        self.assertEdges(analysis, break_node, {NEXT})
+        self.assertEdges(analysis, break_node, EDGES_NEXT)
         self.assertEdge(analysis, break_node, NEXT, while_node)
 
     def test_continue_in_inner_loop(self) -> None:
@@ -1114,17 +1179,17 @@ def f():
             continue
 """
         analysis, while_node = self._function_analysis(code)
-        self.assertEdges(analysis, while_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, while_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, while_node, ELSE, analysis.leave_node)
         self.assertEdge(analysis, while_node, ERROR, analysis.raise_node)
 
         inner_while_node = analysis.edge(while_node, ENTER)
-        self.assertEdges(analysis, inner_while_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, inner_while_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, inner_while_node, ELSE, while_node)
         self.assertEdge(analysis, inner_while_node, ERROR, analysis.raise_node)
 
         continue_node = analysis.edge(inner_while_node, ENTER)
-        self.assertEdges(analysis, continue_node, {NEXT})
+        self.assertEdges(analysis, continue_node, EDGES_NEXT)
         self.assertEdge(analysis, continue_node, NEXT, inner_while_node)
 
     def test_break_in_except(self) -> None:
@@ -1140,18 +1205,18 @@ def f():
 """
         analysis, for_node = self._function_analysis(code)
 
-        self.assertEdges(analysis, for_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, for_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, for_node, ELSE, analysis.leave_node)
         self.assertEdge(analysis, for_node, ERROR, analysis.raise_node)
 
         try_node = analysis.edge(for_node, ENTER)
-        self.assertEdges(analysis, try_node, {NEXT})
+        self.assertEdges(analysis, try_node, EDGES_NEXT)
 
         raise_node = analysis.edge(try_node, NEXT)
-        self.assertEdges(analysis, raise_node, {ERROR})
+        self.assertEdges(analysis, raise_node, EDGES_ERROR)
 
         except_node = analysis.edge(raise_node, ERROR)
-        self.assertEdges(analysis, except_node, {ENTER, ELSE, ERROR})
+        self.assertEdges(analysis, except_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(
             analysis,
             except_node,
@@ -1160,15 +1225,15 @@ def f():
         )
 
         finally_raise_node = analysis.edge(except_node, ERROR)
-        self.assertEdges(analysis, finally_raise_node, {NEXT, ERROR})
+        self.assertEdges(analysis, finally_raise_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, finally_raise_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, finally_raise_node, NEXT, analysis.raise_node)
 
         break_node = analysis.edge(except_node, ENTER)
-        self.assertEdges(analysis, break_node, {NEXT})
+        self.assertEdges(analysis, break_node, EDGES_NEXT)
 
         finally_node = analysis.edge(break_node, NEXT)
-        self.assertEdges(analysis, finally_node, {NEXT, ERROR})
+        self.assertEdges(analysis, finally_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, finally_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, finally_node, NEXT, analysis.leave_node)
 
@@ -1187,30 +1252,30 @@ def f():
 """
         analysis, for_node = self._function_analysis(code)
 
-        self.assertEdges(analysis, for_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, for_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, for_node, ELSE, analysis.leave_node)
         self.assertEdge(analysis, for_node, ERROR, analysis.raise_node)
 
         try_node = analysis.edge(for_node, ENTER)
-        self.assertEdges(analysis, try_node, {NEXT})
+        self.assertEdges(analysis, try_node, EDGES_NEXT)
 
         do_node = analysis.edge(try_node, NEXT)
-        self.assertEdges(analysis, do_node, {NEXT, ERROR})
+        self.assertEdges(analysis, do_node, EDGES_NEXT_ERROR)
 
         pass_node = analysis.edge(do_node, ERROR)
         self.assertNodetype(pass_node, ast.Pass)
-        self.assertEdges(analysis, pass_node, {NEXT})
+        self.assertEdges(analysis, pass_node, EDGES_NEXT)
 
         finally1_node = analysis.edge(pass_node, NEXT)
-        self.assertEdges(analysis, finally1_node, {NEXT, ERROR})
+        self.assertEdges(analysis, finally1_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, finally1_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, finally1_node, NEXT, for_node)
 
         else_node = analysis.edge(do_node, NEXT)
-        self.assertEdges(analysis, else_node, {NEXT})
+        self.assertEdges(analysis, else_node, EDGES_NEXT)
 
         finally_node = analysis.edge(else_node, NEXT)
-        self.assertEdges(analysis, finally_node, {NEXT, ERROR})
+        self.assertEdges(analysis, finally_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, finally_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, finally_node, NEXT, analysis.leave_node)
 
@@ -1224,10 +1289,7 @@ finally:
 """
         analysis, _ = self._module_analysis(code)
         assert_nodes = [
-            node
-            for node in analysis.nodes()
-            if hasattr(node, "ast_node")
-            if isinstance(node.ast_node, ast.Assert)
+            node for node in analysis.nodes() if isinstance(node.ast_node, ast.Assert)
         ]
         self.assertEqual(len(assert_nodes), 1)
 
@@ -1256,12 +1318,12 @@ def f():
         raised_next = analysis.edge(raised_node, NEXT)
         ok_next = analysis.edge(ok_node, NEXT)
 
-        self.assertEqual(raised_next, ok_next)
+        self.assertIs(raised_next, ok_next)
 
     def test_empty_module(self) -> None:
         code = ""
         analysis, enter_node = self._module_analysis(code)
-        self.assertEqual(enter_node, analysis.leave_node)
+        self.assertIs(enter_node, analysis.leave_node)
 
     def test_just_pass(self) -> None:
         code = """\
@@ -1269,7 +1331,7 @@ pass
 """
         analysis, enter_node = self._module_analysis(code)
         self.assertNodetype(enter_node, ast.Pass)
-        self.assertEdges(analysis, enter_node, {NEXT})
+        self.assertEdges(analysis, enter_node, EDGES_NEXT)
         self.assertEdge(analysis, enter_node, NEXT, analysis.leave_node)
 
     def test_statements_outside_function(self) -> None:
@@ -1282,21 +1344,21 @@ except:
 """
         analysis, assign_node = self._module_analysis(code)
         self.assertNodetype(assign_node, ast.Assign)
-        self.assertEdges(analysis, assign_node, {NEXT, ERROR})
+        self.assertEdges(analysis, assign_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, assign_node, ERROR, analysis.raise_node)
 
         try_node = analysis.edge(assign_node, NEXT)
         self.assertNodetype(try_node, ast.Try)
-        self.assertEdges(analysis, try_node, {NEXT})
+        self.assertEdges(analysis, try_node, EDGES_NEXT)
 
         do_node = analysis.edge(try_node, NEXT)
         self.assertNodetype(do_node, ast.Expr)
-        self.assertEdges(analysis, do_node, {NEXT, ERROR})
+        self.assertEdges(analysis, do_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, do_node, NEXT, analysis.leave_node)
 
         pass_node = analysis.edge(do_node, ERROR)
         self.assertNodetype(pass_node, ast.Pass)
-        self.assertEdges(analysis, pass_node, {NEXT})
+        self.assertEdges(analysis, pass_node, EDGES_NEXT)
         self.assertEdge(analysis, pass_node, NEXT, analysis.leave_node)
 
     def test_with(self) -> None:
@@ -1306,12 +1368,12 @@ with some_cm() as name:
 """
         analysis, with_node = self._module_analysis(code)
         self.assertNodetype(with_node, ast.With)
-        self.assertEdges(analysis, with_node, {ENTER, ERROR})
+        self.assertEdges(analysis, with_node, EDGES_ENTER_ERROR)
         self.assertEdge(analysis, with_node, ERROR, analysis.raise_node)
 
         body_node = analysis.edge(with_node, ENTER)
         self.assertNodetype(body_node, ast.Expr)
-        self.assertEdges(analysis, body_node, {NEXT, ERROR})
+        self.assertEdges(analysis, body_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, body_node, ERROR, analysis.raise_node)
         self.assertEdge(analysis, body_node, NEXT, analysis.leave_node)
 
@@ -1323,13 +1385,13 @@ async def f():
 """
         analysis, for_node = self._function_analysis(code)
         self.assertNodetype(for_node, ast.AsyncFor)
-        self.assertEdges(analysis, for_node, {ELSE, ENTER, ERROR})
+        self.assertEdges(analysis, for_node, EDGES_ELSE_ENTER_ERROR)
         self.assertEdge(analysis, for_node, ELSE, analysis.leave_node)
         self.assertEdge(analysis, for_node, ERROR, analysis.raise_node)
 
         yield_node = analysis.edge(for_node, ENTER)
         self.assertNodetype(yield_node, ast.Expr)
-        self.assertEdges(analysis, yield_node, {NEXT, ERROR})
+        self.assertEdges(analysis, yield_node, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, yield_node, NEXT, for_node)
         self.assertEdge(analysis, yield_node, ERROR, analysis.raise_node)
 
@@ -1341,12 +1403,12 @@ async def f():
 """
         analysis, with_node = self._function_analysis(code)
         self.assertNodetype(with_node, ast.AsyncWith)
-        self.assertEdges(analysis, with_node, {ENTER, ERROR})
+        self.assertEdges(analysis, with_node, EDGES_ENTER_ERROR)
         self.assertEdge(analysis, with_node, ERROR, analysis.raise_node)
 
         pass_node = analysis.edge(with_node, ENTER)
         self.assertNodetype(pass_node, ast.Pass)
-        self.assertEdges(analysis, pass_node, {NEXT})
+        self.assertEdges(analysis, pass_node, EDGES_NEXT)
         self.assertEdge(analysis, pass_node, NEXT, analysis.leave_node)
 
     def test_classdef(self) -> None:
@@ -1357,7 +1419,7 @@ class SomeClass:
 """
         analysis, initial = self._class_analysis(code)
         self.assertNodetype(initial, ast.FunctionDef)
-        self.assertEdges(analysis, initial, {NEXT, ERROR})
+        self.assertEdges(analysis, initial, EDGES_NEXT_ERROR)
         self.assertEdge(analysis, initial, NEXT, analysis.leave_node)
         self.assertEdge(analysis, initial, ERROR, analysis.raise_node)
 
@@ -1369,7 +1431,7 @@ def f():
         analysis, _ = self._function_analysis(code)
         node = analysis.entry_node
         self.assertNodetype(node, ast.Global)
-        self.assertEdges(analysis, node, {NEXT})
+        self.assertEdges(analysis, node, EDGES_NEXT)
         self.assertEdge(analysis, node, NEXT, analysis.leave_node)
 
     def test_nonlocal(self) -> None:
@@ -1378,14 +1440,14 @@ def f(bob):
     def g():
         nonlocal bob
 """
-        module_node = compile(code, "test_cf", "exec", ast.PyCF_ONLY_AST)
+        module_node = parse(code)
         (function_node,) = module_node.body
         (inner_function,) = function_node.body
 
         analysis = CFAnalyser().analyse_function(inner_function)
         node = analysis.entry_node
         self.assertNodetype(node, ast.Nonlocal)
-        self.assertEdges(analysis, node, {NEXT})
+        self.assertEdges(analysis, node, EDGES_NEXT)
         self.assertEdge(analysis, node, NEXT, analysis.leave_node)
 
     def test_assorted_simple_statements(self) -> None:
@@ -1406,12 +1468,12 @@ async def beckett():
         analysis, node = self._module_analysis(code)
 
         for _ in range(9):
-            self.assertNodetype(node, ast.stmt)
-            self.assertEdges(analysis, node, {NEXT, ERROR})
+            self.assertIsInstance(node.ast_node, ast.stmt)
+            self.assertEdges(analysis, node, EDGES_NEXT_ERROR)
             self.assertEdge(analysis, node, ERROR, analysis.raise_node)
             node = analysis.edge(node, NEXT)
 
-        self.assertEqual(node, analysis.leave_node)
+        self.assertIs(node, analysis.leave_node)
 
     def test_function_cant_raise(self) -> None:
         code = """\
@@ -1473,7 +1535,9 @@ except:
 
     # Assertions
 
-    def assertEdges(self, analysis: CFAnalysis, node: CFNode, edges: Set[str]) -> None:
+    def assertEdges(
+        self, analysis: CFAnalysis, node: CFNode, edges: AbstractSet[str]
+    ) -> None:
         """
         Assert that the outward edges from a node have the given names.
         """
@@ -1486,21 +1550,31 @@ except:
         Assert that the given edge from the given source maps to the
         given target.
         """
-        self.assertEqual(analysis.edge(source, label), target)
+        self.assertIs(analysis.edge(source, label), target)
 
     def assertNodetype(self, node: CFNode, nodetype: Type[ast.AST]) -> None:
         """
         Assert that the given control-flow analysis node is associated
-        to an ast node of the given type.
+        to an ast node of exactly the given type.
+        """
+        self.assertIs(type(node.ast_node), nodetype)
+
+    def assertExitNodesHaveNoEdges(self, analysis: CFAnalysis) -> None:
+        """
+        Assert that the leave, raise and return nodes of an analysis, where
+        present, have no outward edges.
         """
-        self.assertIsInstance(node.ast_node, nodetype)
+        exit_nodes = (analysis.leave_node, analysis.raise_node, analysis.return_node)
+        for node in exit_nodes:
+            if node is not None:
+                self.assertEdges(analysis, node, EDGES_NONE)
 
     def assertAllStatementsCovered(self, code: str) -> None:
         """
         Check that all statements in the given code are covered
         by the analysis.
         """
-        tree = compile(code, "test_cf", "exec", ast.PyCF_ONLY_AST)
+        tree = parse(code)
         self.assertIsInstance(tree, ast.Module)
         analysis = CFAnalyser().analyse_module(tree)
         self.assertEqual(analysed_statements(analysis), all_statements(tree))
@@ -1510,7 +1584,7 @@ except:
         Check that all statements in the given code are covered
         by the analysis.
         """
-        tree = compile(code, "test_cf", "exec", ast.PyCF_ONLY_AST).body[0]
+        tree = parse(code).body[0]
         self.assertIsInstance(tree, ast.FunctionDef)
         analysis = CFAnalyser().analyse_function(tree)
         self.assertEqual(analysed_statements(analysis), all_statements(tree) - {tree})
@@ -1518,43 +1592,32 @@ except:
     # Helper methods
 
     def _function_analysis(self, code: str) -> Tuple[CFAnalysis, CFNode]:
-        function_node = compile(code, "test_cf", "exec", ast.PyCF_ONLY_AST).body[0]
+        function_node = parse(code).body[0]
         self.assertIsInstance(function_node, (ast.AsyncFunctionDef, ast.FunctionDef))
 
         analysis = CFAnalyser().analyse_function(function_node)
-        if analysis.raise_node is not None:
-            self.assertEdges(analysis, analysis.raise_node, set())
-        if analysis.leave_node is not None:
-            self.assertEdges(analysis, analysis.leave_node, set())
-        if analysis.return_node is not None:
-            self.assertEdges(analysis, analysis.return_node, set())
+        self.assertExitNodesHaveNoEdges(analysis)
 
         return analysis, analysis.entry_node
 
     def _module_analysis(self, code: str) -> Tuple[CFAnalysis, CFNode]:
-        module_node = compile(code, "test_cf", "exec", ast.PyCF_ONLY_AST)
+        module_node = parse(code)
         self.assertIsInstance(module_node, ast.Module)
 
         analysis = CFAnalyser().analyse_module(module_node)
 
         self.assertIsNone(analysis.return_node)
-        if analysis.raise_node is not None:
-            self.assertEdges(analysis, analysis.raise_node, set())
-        if analysis.leave_node is not None:
-            self.assertEdges(analysis, analysis.leave_node, set())
+        self.assertExitNodesHaveNoEdges(analysis)
 
         return analysis, analysis.entry_node
 
     def _class_analysis(self, code: str) -> Tuple[CFAnalysis, CFNode]:
-        class_node = compile(code, "test_cf", "exec", ast.PyCF_ONLY_AST).body[0]
+        class_node = parse(code).body[0]
         self.assertIsInstance(class_node, ast.ClassDef)
 
         analysis = CFAnalyser().analyse_class(class_node)
 
         self.assertIsNone(analysis.return_node)
-        if analysis.raise_node is not None:
-            self.assertEdges(analysis, analysis.raise_node, set())
-        if analysis.leave_node is not None:
-            self.assertEdges(analysis, analysis.leave_node, set())
+        self.assertExitNodesHaveNoEdges(analysis)
 
         return analysis, analysis.entry_node